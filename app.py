@@ -3,6 +3,8 @@ import streamlit as st
 from helpers.config import AppConfig
 from helpers.auth import get_user_info, check_user_login
 from helpers.loog import logger
+from helpers.warmup import ensure_warmup
+from helpers.storage import get_conversation_store
 
 # ------------- Application Class -------------
 class App:
@@ -27,6 +29,13 @@ class App:
         if "userinfo" not in st.session_state:
             st.session_state["userinfo"] = None
 
+    def _resume_chat_session(self, user_info: dict):
+        """Return the user's latest stored chat session so a refresh or restart picks the conversation back up."""
+        store = get_conversation_store()
+        if store is None or not user_info or not user_info.get("username"):
+            return None
+        return store.latest_session(user_info["username"])
+
     def run(self):
         self._set_page_config()
         self._set_header()
@@ -50,6 +59,7 @@ class App:
 
         if st.session_state.get("authentication_status") or check_user_login(extend_key="app-check-login"):
             user_info = get_user_info(extend_key="app-after-auth")
+            st.session_state["userinfo"] = user_info
             
             if user_info.get("role") == "administrator":
                 st.session_state["is_admin"] = True
@@ -59,7 +69,7 @@ class App:
                 st.session_state["is_user"] = True
 
             if st.session_state.get("chat_session_id") is None:
-                st.session_state["chat_session_id"] = uuid.uuid1()
+                st.session_state["chat_session_id"] = self._resume_chat_session(user_info) or uuid.uuid1()
 
             if st.session_state.get("is_admin"):
                 pg = st.navigation({
@@ -91,6 +101,7 @@ class App:
 # ------------- Main Execution -------------
 def main():
     try:
+        ensure_warmup()
         app = App()
         app.run()
     except Exception as e:
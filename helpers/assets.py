@@ -0,0 +1,38 @@
+import base64
+from pathlib import Path
+from typing import Union
+from helpers.cache import TTLCache
+from helpers.config import AppConfig
+from helpers.loog import logger
+
+_asset_cache = TTLCache("assets", ttl_seconds=None, maxsize=256)
+
+class AssetIndex(object):
+    """Process-wide index of bundled images, base64-encoded once and reused by every page."""
+
+    extensions = (".png", ".jpg", ".jpeg", ".ico")
+
+    def __init__(self):
+        self.app_conf = AppConfig()
+        self.assets_path = self.app_conf.logo_path.parent
+
+    def load(self) -> int:
+        """Encode every bundled image up front. Returns the number of indexed assets."""
+        count = 0
+        for path in sorted(self.assets_path.rglob("*")):
+            if path.suffix.lower() in self.extensions and self.get_base64(path):
+                count += 1
+        return count
+
+    def get_base64(self, path: Union[Path, str]) -> str:
+        """Return the base64 encoding of the asset at path, reading it from disk only once."""
+        key = str(Path(path).resolve())
+        return _asset_cache.get_or_load(key, lambda: self._encode(key))
+
+    def _encode(self, path: str) -> str:
+        try:
+            with open(path, "rb") as f:
+                return base64.b64encode(f.read()).decode("utf-8")
+        except OSError as e:
+            logger.error(f"[FE-ASSET] Error reading asset {path}: {e}")
+            return None
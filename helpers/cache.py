@@ -0,0 +1,87 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+_caches: Dict[str, "TTLCache"] = {}
+_registry_lock = threading.Lock()
+
+class TTLCache(object):
+    """Thread-safe in-process cache with per-entry expiry and hit/miss counters."""
+
+    def __init__(self, name: str, ttl_seconds: Optional[float] = None, maxsize: int = 1024):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+
+        with _registry_lock:
+            _caches[name] = self
+
+    def _expires_at(self) -> Optional[float]:
+        if self.ttl_seconds is None:
+            return None
+        return time.monotonic() + self.ttl_seconds
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default when missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the oldest entry when full."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (value, self._expires_at())
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss.
+
+        A loader result of None is returned but not cached, so failed fetches
+        are retried on the next call.
+        """
+        sentinel = object()
+        value = self.get(key, sentinel)
+        if value is not sentinel:
+            return value
+        value = loader()
+        if value is not None:
+            self.set(key, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop a single key, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters for this cache."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": (self.hits / total) if total else 0.0,
+            }
+
+def get_cache_stats() -> List[dict]:
+    """Return stats for every cache created in this process."""
+    with _registry_lock:
+        caches = list(_caches.values())
+    return [cache.stats() for cache in caches]
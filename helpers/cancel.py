@@ -0,0 +1,57 @@
+import threading
+from typing import Dict, Optional
+from helpers.loog import logger
+
+class CancellationRegistry(object):
+    """
+    Process-wide cancel flags for in-flight chat generations, keyed by chat_session_id.
+    Any thread (a Stop button callback, a later rerun, a reaper) can cancel a stream it does not own.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: Dict[str, threading.Event] = {}
+        self._responses: Dict[str, object] = {}
+
+    def start(self, key: str) -> threading.Event:
+        """Register a new generation for key and return its cancel flag."""
+        event = threading.Event()
+        with self._lock:
+            self._events[key] = event
+            self._responses.pop(key, None)
+        return event
+
+    def attach(self, key: str, event: threading.Event, response) -> None:
+        """Remember the open response so cancel() can release its connection immediately."""
+        with self._lock:
+            if self._events.get(key) is event:
+                self._responses[key] = response
+
+    def cancel(self, key: str) -> bool:
+        """Flag the generation for key as cancelled and close its response. Returns False if none is running."""
+        with self._lock:
+            event = self._events.get(key)
+            response = self._responses.pop(key, None)
+        if event is None:
+            return False
+        event.set()
+        if response is not None:
+            try:
+                # Unblocks a reader waiting on the next chunk instead of waiting for the backend.
+                response.close()
+            except Exception as e:
+                logger.warning(f"[FE->BE] Error closing cancelled stream: {e}")
+        return True
+
+    def is_running(self, key: str) -> bool:
+        with self._lock:
+            return key in self._events
+
+    def finish(self, key: str, event: Optional[threading.Event]) -> None:
+        """Unregister a generation, unless a newer one already replaced it."""
+        with self._lock:
+            if self._events.get(key) is event:
+                self._events.pop(key, None)
+                self._responses.pop(key, None)
+
+cancellation_registry = CancellationRegistry()
@@ -0,0 +1,38 @@
+from typing import Optional
+from helpers.cache import TTLCache
+from helpers.config import APIConfig
+from helpers.http import MakeRequest
+from helpers.loog import logger
+
+_catalog_cache = TTLCache("catalog", ttl_seconds=APIConfig().catalog_cache_ttl_seconds, maxsize=64)
+
+class CatalogService(object):
+    """Short-lived process cache for the catalog data every Assistant rerun needs."""
+
+    def __init__(self, make_request: Optional[MakeRequest] = None):
+        self.api_conf = APIConfig()
+        self.make_request = make_request or MakeRequest()
+
+    def _load(self, endpoint: str):
+        result = self.make_request.get(endpoint=endpoint)
+        if result is None:
+            return None
+        resp_json, status_code = result
+        if status_code != 200:
+            logger.warning(f"[FE-CATALOG] Unexpected status {status_code} for {endpoint}")
+            return None
+        return resp_json
+
+    def get_default_agent(self) -> Optional[dict]:
+        """Return the default agent, or None when the backend has none."""
+        endpoint = self.api_conf.agent_endpoint + "default"
+        return _catalog_cache.get_or_load(endpoint, lambda: self._load(endpoint))
+
+    def get_enabled_llms(self) -> Optional[list]:
+        """Return the list of enabled LLMs."""
+        endpoint = self.api_conf.llm_endpoint + "enabled"
+        return _catalog_cache.get_or_load(endpoint, lambda: self._load(endpoint))
+
+    def invalidate(self) -> None:
+        """Forget cached catalog data, e.g. after an agent or LLM was updated."""
+        _catalog_cache.invalidate()
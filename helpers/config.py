@@ -25,6 +25,11 @@ class AppConfig(object):
     
     app_jwt_key_name: str = os.getenv("APP_JWT_KEY_NAME", "")
 
+    chat_render_window: int = int(os.getenv("CHAT_RENDER_WINDOW", "20"))  # messages drawn per rerun
+
+    warmup_enabled: bool = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+    warmup_ready_file: str = os.getenv("WARMUP_READY_FILE", "/tmp/yang-genai-chat-ui.ready")
+
 class FileConfig(BaseModel):
     allowed_file_types: list[str] = Field(
         default_factory=lambda: os.getenv(
@@ -40,6 +45,7 @@ class AWSConfig(object):
 
     aws_region: str = os.getenv("AWS_REGION", "us-southeast-1")
     aws_secret_name: str = os.getenv("AWS_SECRET_NAME", "")
+    aws_secret_cache_ttl_seconds: int = int(os.getenv("AWS_SECRET_CACHE_TTL_SECONDS", "300"))
 
 @dataclass
 class APIConfig(object):
@@ -48,14 +54,22 @@ class APIConfig(object):
     api_service: str = os.getenv("API_SERVICE", "")
     api_auth_key_name: str = os.getenv("API_AUTH_KEY_NAME", "")
     api_timeout_seconds: int = int(os.getenv("API_TIMEOUT_SECONDS", "300"))
+    api_max_connections: int = int(os.getenv("API_MAX_CONNECTIONS", "100"))
+    api_max_keepalive_connections: int = int(os.getenv("API_MAX_KEEPALIVE_CONNECTIONS", "20"))
+    api_warm_connections: int = int(os.getenv("API_WARM_CONNECTIONS", "4"))
+    catalog_cache_ttl_seconds: int = int(os.getenv("CATALOG_CACHE_TTL_SECONDS", "60"))
     chat_model_support: List[str] = field(default_factory=lambda: ["claude", "llama", "gpt-oss"])
     max_response_tokens: int = int(os.getenv("MAX_RESPONSE_TOKENS", "512"))
     temperature: float = float(os.getenv("TEMPERATURE", "0.7"))
     top_p: float = float(os.getenv("TOP_P", "0.9"))
+    chat_cancel_enabled: bool = os.getenv("CHAT_CANCEL_ENABLED", "false").lower() == "true"
+    chat_cancel_timeout_seconds: int = int(os.getenv("CHAT_CANCEL_TIMEOUT_SECONDS", "5"))
+    generation_buffer_ttl_seconds: int = int(os.getenv("GENERATION_BUFFER_TTL_SECONDS", "600"))
 
     """API service endpoint."""
     chat_agent_completions_endpoint: str = "chat/agent/completions"
     chat_feedback_endpoint: str = "chat/feedback"
+    chat_cancel_endpoint: str = "chat/cancel"
     agent_endpoint: str = "agents/"
     llm_endpoint: str = "llms/"
     user_endpoint: str = "users/"
@@ -64,6 +78,15 @@ class APIConfig(object):
     tag_endpoint:str = "tags/"
     login_endpoint: str = "authentication/login"
 
+@dataclass
+class StorageConfig(object):
+    """Conversation storage configuration class."""
+
+    chat_storage_enabled: bool = os.getenv("CHAT_STORAGE_ENABLED", "true").lower() == "true"
+    chat_db_path: str = os.getenv("CHAT_DB_PATH", "/var/lib/yang-genai-chat-ui/conversations.db")
+    chat_history_window: int = int(os.getenv("CHAT_HISTORY_WINDOW", "50"))  # messages loaded when a session resumes
+    chat_history_max_in_memory: int = int(os.getenv("CHAT_HISTORY_MAX_IN_MEMORY", "200"))  # older messages stay on disk
+
 @dataclass
 class LogConfig(object):
     """Logging configuration class."""
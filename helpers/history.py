@@ -0,0 +1,128 @@
+import time
+from typing import List, Optional, Sequence
+import streamlit as st
+from helpers.loog import logger
+
+def estimate_tokens(content: str) -> int:
+    """Cheap token estimate (~4 characters per token), good enough for budgeting history."""
+    if not content:
+        return 0
+    return max(1, len(content) // 4)
+
+class ChatMessage(object):
+    """A single chat turn. Kept deliberately small: one instance per message per session."""
+
+    __slots__ = ("role", "content", "token_count", "timestamp", "attachments")
+
+    def __init__(self, role: str, content: str, timestamp: Optional[float] = None, attachments: Optional[Sequence[str]] = None, token_count: Optional[int] = None):
+        self.role = role
+        self.content = content
+        self.token_count = estimate_tokens(content) if token_count is None else token_count
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.attachments = tuple(attachments) if attachments else ()
+
+    @property
+    def type(self) -> str:
+        """Message type in the human/ai vocabulary used by the backend payload."""
+        return "human" if self.role == "user" else "ai"
+
+    def __repr__(self) -> str:
+        return f"ChatMessage(role={self.role!r}, token_count={self.token_count}, attachments={len(self.attachments)})"
+
+class HistorySnapshot(object):
+    """Frozen view of the messages at one point in time, safe to hand to a worker thread."""
+
+    __slots__ = ("messages",)
+
+    def __init__(self, messages: Sequence[ChatMessage]):
+        self.messages = tuple(messages)
+
+class ChatHistory(object):
+    """
+    Chat history stored as a plain list of ChatMessage in st.session_state[key].
+    Drop-in for the subset of StreamlitChatMessageHistory used by the Assistant page.
+
+    When bound to a ConversationStore, completed messages are written through to disk,
+    a resumed session only loads the most recent window, and the in-memory list is capped
+    so older messages stay on disk until paged back in with load_earlier().
+    """
+
+    def __init__(self, key: str = "chat_history", store=None, user_id: Optional[str] = None, chat_session_id: Optional[str] = None, window: int = 50, max_in_memory: int = 200):
+        self.key = key
+        self.offset_key = f"{key}_offset"
+        self.binding_key = f"{key}_binding"
+        self.store = store if (store is not None and user_id and chat_session_id) else None
+        self.user_id = user_id
+        self.chat_session_id = str(chat_session_id) if chat_session_id else None
+        self.max_in_memory = max(max_in_memory, window)
+
+        binding = (self.user_id, self.chat_session_id) if self.store else None
+        if key not in st.session_state or not isinstance(st.session_state[key], list) or st.session_state.get(self.binding_key) != binding:
+            st.session_state[key] = []
+            st.session_state[self.offset_key] = 0
+            st.session_state[self.binding_key] = binding
+            if self.store:
+                self._load_recent(window)
+
+    def _load_recent(self, window: int) -> None:
+        total = self.store.count(self.user_id, self.chat_session_id)
+        messages = self.store.load_recent(self.user_id, self.chat_session_id, window)
+        st.session_state[self.key] = messages
+        st.session_state[self.offset_key] = total - len(messages)
+
+    @property
+    def messages(self) -> List[ChatMessage]:
+        return st.session_state[self.key]
+
+    @property
+    def offset(self) -> int:
+        """Absolute position of the first in-memory message; earlier ones live only in the store."""
+        return st.session_state.get(self.offset_key, 0)
+
+    @property
+    def has_earlier(self) -> bool:
+        return self.offset > 0
+
+    def position_of(self, index: int) -> int:
+        """Absolute conversation position of the in-memory message at index."""
+        return self.offset + index
+
+    def add_message(self, message: ChatMessage) -> ChatMessage:
+        self.messages.append(message)
+        if self.store:
+            try:
+                self.store.append(self.user_id, self.chat_session_id, self.position_of(len(self.messages) - 1), message)
+            except Exception as e:
+                logger.error(f"[FE-STORAGE] Unable to persist message: {e}")
+            overflow = len(self.messages) - self.max_in_memory
+            if overflow > 0:
+                del self.messages[:overflow]
+                st.session_state[self.offset_key] = self.offset + overflow
+        return message
+
+    def add_user_message(self, content: str, attachments: Optional[Sequence[str]] = None) -> ChatMessage:
+        return self.add_message(ChatMessage("user", content, attachments=attachments))
+
+    def add_ai_message(self, content: str) -> ChatMessage:
+        return self.add_message(ChatMessage("assistant", content))
+
+    def load_earlier(self, count: int) -> int:
+        """Page up to `count` older messages back in from the store. Returns how many were loaded."""
+        if not self.store or not self.has_earlier:
+            return 0
+        earlier = self.store.load_before(self.user_id, self.chat_session_id, self.offset, count)
+        self.messages[:0] = earlier
+        st.session_state[self.offset_key] = self.offset - len(earlier)
+        return len(earlier)
+
+    def snapshot(self) -> HistorySnapshot:
+        return HistorySnapshot(self.messages)
+
+    def clear(self) -> None:
+        st.session_state[self.key] = []
+        st.session_state[self.offset_key] = 0
+
+    @property
+    def token_count(self) -> int:
+        """Total estimated tokens across the in-memory history."""
+        return sum(m.token_count for m in self.messages)
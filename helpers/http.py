@@ -1,10 +1,32 @@
 import httpx
+import threading
 import streamlit as st
+from concurrent.futures import ThreadPoolExecutor
 from helpers.loog import logger
+from helpers.cancel import cancellation_registry
 from helpers.secret import AWSSecretManager
 from helpers.utils import Utils
 from helpers.config import AppConfig, AWSConfig, APIConfig
 
+_client = None
+_client_lock = threading.Lock()
+
+def get_http_client() -> httpx.Client:
+    """Return the process-wide pooled HTTP client shared by every session."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                api_conf = APIConfig()
+                _client = httpx.Client(
+                    timeout=api_conf.api_timeout_seconds,
+                    limits=httpx.Limits(
+                        max_connections=api_conf.api_max_connections,
+                        max_keepalive_connections=api_conf.api_max_keepalive_connections,
+                    ),
+                )
+    return _client
+
 class MakeRequest(object):
     def __init__(self):
         self.app_conf = AppConfig()
@@ -12,9 +34,31 @@ class MakeRequest(object):
         self.api_conf = APIConfig()
         self.aws_secret_manager = AWSSecretManager()
 
-    def stream_chat_completions(self, agent_name: str, chat_model: str, history: dict, prompt: str, attachments: list):
+    @property
+    def client(self) -> httpx.Client:
+        return get_http_client()
+
+    def warm_connections(self, count: int) -> int:
+        """
+        Open up to `count` keep-alive connections to the backend so the first requests skip the handshake.
+        Returns the number of connections that answered.
+        """
+        def touch(_):
+            try:
+                self.client.get(self.api_conf.api_service, timeout=self.api_conf.api_timeout_seconds)
+                return True
+            except httpx.HTTPError as e:
+                logger.warning(f"[FE->BE] Warm connection error: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(count, 1)) as executor:
+            return sum(executor.map(touch, range(count)))
+
+    def stream_chat_completions(self, agent_name: str, chat_model: str, history: dict, prompt: str, attachments: list, chat_session_id: str = None):
         """
         Stream tokens from backend API (StreamingResponse).
+        The stream can be stopped with cancel_chat_completions(chat_session_id); closing the generator
+        also releases the connection and asks the backend to abort the generation.
         """
 
         messages = []
@@ -91,7 +135,7 @@ class MakeRequest(object):
         if isinstance(messages, tuple):
             messages = list(messages)
 
-        chat_session = st.session_state.get("chat_session_id")
+        chat_session = chat_session_id if chat_session_id is not None else st.session_state.get("chat_session_id")
 
         payload = {
             "chat_session_id": str(chat_session),
@@ -105,15 +149,52 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }
 
+        cancel_key = str(chat_session)
+        cancel_event = cancellation_registry.start(cancel_key)
+        completed = False
         try:
-            with httpx.stream("POST", self.api_conf.api_service + self.api_conf.chat_agent_completions_endpoint, headers=headers, json=payload, timeout=self.api_conf.api_timeout_seconds) as r:
+            with self.client.stream("POST", self.api_conf.api_service + self.api_conf.chat_agent_completions_endpoint, headers=headers, json=payload, timeout=self.api_conf.api_timeout_seconds) as r:
+                cancellation_registry.attach(cancel_key, cancel_event, r)
                 r.raise_for_status()
                 for chunk in r.iter_bytes(chunk_size=None):
+                    if cancel_event.is_set():
+                        break
                     if chunk:
                         yield chunk.decode('utf-8')
+                else:
+                    completed = True
+        except (httpx.HTTPError, httpx.StreamError) as e:
+            if not cancel_event.is_set():
+                completed = True
+                logger.error(f"[FE->BE] Stream error: {e}")
+                yield f"\n[Error] Unable connect to backend service. Please try again."
+        finally:
+            # Runs on normal exit, on cancel and when the consumer closes or abandons the generator.
+            cancellation_registry.finish(cancel_key, cancel_event)
+            if not completed:
+                logger.info(f"[FE->BE] Stream cancelled for chat session {cancel_key}")
+                self.abort_chat_completions(cancel_key)
+
+    def cancel_chat_completions(self, chat_session_id: str) -> bool:
+        """
+        Stop the in-flight generation for a chat session, from any thread.
+        """
+        return cancellation_registry.cancel(str(chat_session_id))
+
+    def abort_chat_completions(self, chat_session_id: str):
+        """
+        Ask the backend to stop generating for a chat session (optional, see CHAT_CANCEL_ENABLED).
+        """
+        if not self.api_conf.chat_cancel_enabled:
+            return
+        headers = {
+            "Content-Type": "application/json",
+            "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
+        }
+        try:
+            self.client.post(self.api_conf.api_service + self.api_conf.chat_cancel_endpoint, headers=headers, json={"chat_session_id": chat_session_id}, timeout=self.api_conf.chat_cancel_timeout_seconds)
         except httpx.HTTPError as e:
-            logger.error(f"[FE->BE] Stream error: {e}")
-            yield f"\n[Error] Unable connect to backend service. Please try again."
+            logger.warning(f"[FE->BE] Cancel error: {e}")
     
     def post_streaming(self, endpoint: str, data: dict):
         """
@@ -124,7 +205,7 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }
         try:
-            response = httpx.stream("POST", self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
+            response = self.client.stream("POST", self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
             response.raise_for_status()
             return response.json()
         except httpx.HTTPError as e:
@@ -140,7 +221,7 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }        
         try:
-            response = httpx.get(self.api_conf.api_service + endpoint, headers=headers, params=param, timeout=self.api_conf.api_timeout_seconds)
+            response = self.client.get(self.api_conf.api_service + endpoint, headers=headers, params=param, timeout=self.api_conf.api_timeout_seconds)
             return response.json(), response.status_code
         except httpx.HTTPError as e:
             logger.error(f"[FE->BE] GET error: {e}")
@@ -154,7 +235,7 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }        
         try:
-            response = httpx.post(self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
+            response = self.client.post(self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
             return response.json(), response.status_code
         except httpx.HTTPError as e:
             logger.error(f"[FE->BE] PUT error: {e}")
@@ -168,7 +249,7 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }        
         try:
-            response = httpx.put(self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
+            response = self.client.put(self.api_conf.api_service + endpoint, headers=headers, json=data, timeout=self.api_conf.api_timeout_seconds)
             return response.json(), response.status_code
         except httpx.HTTPError as e:
             logger.error(f"[FE->BE] GET error: {e}")
@@ -182,7 +263,7 @@ class MakeRequest(object):
             "x-yang-auth": f"Basic {self.aws_secret_manager.get_secret(self.api_conf.api_auth_key_name)}",
         }        
         try:
-            response = httpx.delete(self.api_conf.api_service + endpoint, headers=headers, timeout=self.api_conf.api_timeout_seconds)
+            response = self.client.delete(self.api_conf.api_service + endpoint, headers=headers, timeout=self.api_conf.api_timeout_seconds)
             return response.json(), response.status_code
         except httpx.HTTPError as e:
             logger.error(f"[FE->BE] DELETE error: {e}")
\ No newline at end of file
@@ -1,35 +1,53 @@
+import json
+import threading
+from typing import Optional
 import boto3
 from botocore.exceptions import ClientError
+from helpers.cache import TTLCache
 from helpers.config import AppConfig, AWSConfig
 from helpers.loog import logger
 
+_client = None
+_client_lock = threading.Lock()
+_secret_cache = TTLCache("secrets", ttl_seconds=AWSConfig().aws_secret_cache_ttl_seconds, maxsize=8)
+
 class AWSSecretManager(object):
 
     def __init__(self):
         self.app_conf = AppConfig()
         self.aws_conf = AWSConfig()
-        self._client = None
 
     @property
     def client(self):
-        if self._client is None:
-            session = boto3.session.Session()
-            self._client = session.client(
-                service_name='secretsmanager',
-                region_name=self.aws_conf.aws_region
-            )
-        return self._client
-    
-    def get_secret(self, secret_key: str) -> str:
+        # One boto3 client per process; creating it is far more expensive than the call itself.
+        global _client
+        if _client is None:
+            with _client_lock:
+                if _client is None:
+                    session = boto3.session.Session()
+                    _client = session.client(
+                        service_name='secretsmanager',
+                        region_name=self.aws_conf.aws_region
+                    )
+        return _client
+
+    def _fetch_secret_bundle(self) -> Optional[dict]:
         try:
-            
             get_secret_value_response = self.client.get_secret_value(
                 SecretId=self.aws_conf.aws_secret_name
             )
-            secret_value = get_secret_value_response['SecretString']
-            secret = eval(secret_value).get(secret_key, "")
-
-            return secret
+            return json.loads(get_secret_value_response['SecretString'])
         except ClientError as e:
-            logger.error(f"[FE-AWS] Error retrieving secret {secret_key}: {e}")
+            logger.error(f"[FE-AWS] Error retrieving secret bundle {self.aws_conf.aws_secret_name}: {e}")
+            return None
+
+    def get_secret_bundle(self) -> Optional[dict]:
+        """Return the whole secret bundle, fetched at most once per cache TTL."""
+        return _secret_cache.get_or_load(self.aws_conf.aws_secret_name, self._fetch_secret_bundle)
+
+    def get_secret(self, secret_key: str) -> str:
+        bundle = self.get_secret_bundle()
+        if bundle is None:
+            logger.error(f"[FE-AWS] Error retrieving secret {secret_key}")
             return None
+        return bundle.get(secret_key, "")
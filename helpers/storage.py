@@ -0,0 +1,130 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+from helpers.config import StorageConfig
+from helpers.history import ChatMessage
+from helpers.loog import logger
+
+_store = None
+_store_lock = threading.Lock()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    chat_session_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    content TEXT NOT NULL,
+    token_count INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    attachments TEXT NOT NULL DEFAULT '[]',
+    UNIQUE (user_id, chat_session_id, position)
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    user_id TEXT NOT NULL,
+    chat_session_id TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_id, chat_session_id)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions (user_id, updated_at);
+"""
+
+class ConversationStore(object):
+    """
+    SQLite (WAL) persistence for chat messages, keyed by user and chat_session_id.
+    Messages carry their absolute position in the conversation so windows can be paged in any order.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.storage_conf = StorageConfig()
+        self.db_path = db_path or self.storage_conf.chat_db_path
+        self._local = threading.local()
+
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._connection()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared across threads; keep one per thread.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def append(self, user_id: str, chat_session_id: str, position: int, message: ChatMessage) -> None:
+        """Persist one completed message at its absolute position."""
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO messages (user_id, chat_session_id, position, role, content, token_count, timestamp, attachments) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (user_id, chat_session_id, position, message.role, message.content, message.token_count, message.timestamp, json.dumps(list(message.attachments))),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (user_id, chat_session_id, updated_at) VALUES (?, ?, ?)",
+                (user_id, chat_session_id, time.time()),
+            )
+
+    def _rows_to_messages(self, rows) -> List[ChatMessage]:
+        return [
+            ChatMessage(role, content, timestamp=timestamp, attachments=json.loads(attachments), token_count=token_count)
+            for role, content, token_count, timestamp, attachments in reversed(rows)
+        ]
+
+    def load_recent(self, user_id: str, chat_session_id: str, limit: int) -> List[ChatMessage]:
+        """Return the most recent `limit` messages, oldest first."""
+        rows = self._connection().execute(
+            "SELECT role, content, token_count, timestamp, attachments FROM messages "
+            "WHERE user_id = ? AND chat_session_id = ? ORDER BY position DESC LIMIT ?",
+            (user_id, chat_session_id, limit),
+        ).fetchall()
+        return self._rows_to_messages(rows)
+
+    def load_before(self, user_id: str, chat_session_id: str, before_position: int, limit: int) -> List[ChatMessage]:
+        """Return up to `limit` messages preceding `before_position`, oldest first."""
+        rows = self._connection().execute(
+            "SELECT role, content, token_count, timestamp, attachments FROM messages "
+            "WHERE user_id = ? AND chat_session_id = ? AND position < ? ORDER BY position DESC LIMIT ?",
+            (user_id, chat_session_id, before_position, limit),
+        ).fetchall()
+        return self._rows_to_messages(rows)
+
+    def count(self, user_id: str, chat_session_id: str) -> int:
+        """Return the number of stored messages in the conversation."""
+        row = self._connection().execute(
+            "SELECT COUNT(*) FROM messages WHERE user_id = ? AND chat_session_id = ?",
+            (user_id, chat_session_id),
+        ).fetchone()
+        return row[0]
+
+    def latest_session(self, user_id: str) -> Optional[str]:
+        """Return the user's most recently updated chat_session_id, if any."""
+        row = self._connection().execute(
+            "SELECT chat_session_id FROM sessions WHERE user_id = ? ORDER BY updated_at DESC LIMIT 1",
+            (user_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+def get_conversation_store() -> Optional[ConversationStore]:
+    """Return the process-wide conversation store, or None when storage is disabled or unavailable."""
+    global _store
+    if _store is None:
+        storage_conf = StorageConfig()
+        if not storage_conf.chat_storage_enabled:
+            return None
+        with _store_lock:
+            if _store is None:
+                try:
+                    _store = ConversationStore(storage_conf.chat_db_path)
+                except (OSError, sqlite3.Error) as e:
+                    logger.error(f"[FE-STORAGE] Unable to open conversation store: {e}")
+                    return None
+    return _store
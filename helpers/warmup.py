@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from helpers.assets import AssetIndex
+from helpers.catalog import CatalogService
+from helpers.config import AppConfig, APIConfig
+from helpers.http import MakeRequest
+from helpers.loog import logger
+from helpers.secret import AWSSecretManager
+
+_started = False
+_ready = threading.Event()
+_lock = threading.Lock()
+_status: dict = {}
+
+class WarmUp(object):
+    """
+    Preload everything the first users of a fresh process would otherwise pay for:
+    the secret bundle, pooled backend connections, the asset index and the default catalogs.
+    """
+
+    def __init__(self):
+        self.app_conf = AppConfig()
+        self.api_conf = APIConfig()
+        self.aws_secret_manager = AWSSecretManager()
+        self.make_request = MakeRequest()
+        self.catalog = CatalogService(self.make_request)
+        self.asset_index = AssetIndex()
+
+    def steps(self) -> list:
+        return [
+            ("secrets", lambda: self.aws_secret_manager.get_secret_bundle() is not None),
+            ("connections", lambda: self.make_request.warm_connections(self.api_conf.api_warm_connections) > 0),
+            ("assets", lambda: self.asset_index.load() > 0),
+            ("default_agent", lambda: self.catalog.get_default_agent() is not None),
+            ("enabled_llms", lambda: self.catalog.get_enabled_llms() is not None),
+        ]
+
+    def run(self) -> dict:
+        """Run every warm-up step, recording its outcome and duration. A failing step never aborts the others."""
+        status = {}
+        for name, step in self.steps():
+            started = time.perf_counter()
+            try:
+                ok = bool(step())
+            except Exception as e:
+                logger.error(f"[FE-WARMUP] Step {name} failed: {e}")
+                ok = False
+            status[name] = {"ok": ok, "duration_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+        logger.info({"message": "[FE-WARMUP] Warm-up finished", "steps": status})
+        return status
+
+    def mark_ready(self) -> None:
+        """Expose readiness to the container health check through the ready file."""
+        _ready.set()
+        try:
+            with open(self.app_conf.warmup_ready_file, "w") as f:
+                f.write(str(os.getpid()))
+        except OSError as e:
+            logger.error(f"[FE-WARMUP] Unable to write ready file: {e}")
+
+    def clear_ready(self) -> None:
+        _ready.clear()
+        try:
+            os.remove(self.app_conf.warmup_ready_file)
+        except FileNotFoundError:
+            pass
+
+def _run_warmup():
+    warmup = WarmUp()
+    _status.update(warmup.run())
+    warmup.mark_ready()
+
+def ensure_warmup() -> None:
+    """Start the warm-up stage in the background, once per process."""
+    global _started
+    if _started:
+        return
+    with _lock:
+        if _started:
+            return
+        _started = True
+
+    warmup = WarmUp()
+    if not warmup.app_conf.warmup_enabled:
+        warmup.mark_ready()
+        return
+
+    warmup.clear_ready()
+    threading.Thread(target=_run_warmup, name="yang-warmup", daemon=True).start()
+
+def is_ready() -> bool:
+    return _ready.is_set()
+
+def get_status() -> dict:
+    return dict(_status)
@@ -0,0 +1,158 @@
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+from helpers.config import APIConfig
+from helpers.loog import logger
+
+class GenerationBuffer(object):
+    """
+    Session-owned buffer a background worker streams into.
+    Streamlit reruns never touch the worker; they only read from the buffer.
+    """
+
+    QUEUED = "queued"
+    STREAMING = "streaming"
+    DONE = "done"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    def __init__(self, chat_session_id: str, agent_name: str = None, chat_model: str = None):
+        self.chat_session_id = chat_session_id
+        self.agent_name = agent_name
+        self.chat_model = chat_model
+        self.status = self.QUEUED
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.committed = False
+        self._chunks: List[str] = []
+        self._cond = threading.Condition()
+
+    @property
+    def text(self) -> str:
+        with self._cond:
+            return "".join(self._chunks)
+
+    @property
+    def chunk_count(self) -> int:
+        with self._cond:
+            return len(self._chunks)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (self.DONE, self.CANCELLED, self.FAILED)
+
+    def set_status(self, status: str) -> None:
+        with self._cond:
+            self.status = status
+            if status == self.STREAMING and self.started_at is None:
+                self.started_at = time.time()
+            self._cond.notify_all()
+
+    def append(self, chunk: str) -> None:
+        with self._cond:
+            self._chunks.append(chunk)
+            self._cond.notify_all()
+
+    def finish(self, status: str, error: Optional[str] = None) -> None:
+        with self._cond:
+            self.status = status
+            self.error = error
+            self.finished_at = time.time()
+            self._cond.notify_all()
+
+    def wait_for_update(self, seen_chunks: int, timeout: float) -> None:
+        """Block until a chunk beyond seen_chunks arrives, the status changes to done, or timeout."""
+        with self._cond:
+            self._cond.wait_for(lambda: len(self._chunks) > seen_chunks or self.done, timeout=timeout)
+
+class GenerationWorker(threading.Thread):
+    """Consumes stream_chat_completions on its own thread and writes into a GenerationBuffer."""
+
+    def __init__(self, buffer: GenerationBuffer, stream_factory: Callable, on_complete: Optional[Callable[[GenerationBuffer], None]] = None):
+        super().__init__(name=f"yang-generation-{buffer.chat_session_id}", daemon=True)
+        self.buffer = buffer
+        self.stream_factory = stream_factory
+        self.on_complete = on_complete
+        self.cancelled = threading.Event()
+
+    def run(self):
+        stream = None
+        status, error = GenerationBuffer.DONE, None
+        try:
+            self.buffer.set_status(GenerationBuffer.STREAMING)
+            stream = self.stream_factory()
+            for chunk in stream:
+                self.buffer.append(chunk)
+            if self.cancelled.is_set():
+                status = GenerationBuffer.CANCELLED
+        except Exception as e:
+            logger.error(f"[FE-WORKER] Generation failed for chat session {self.buffer.chat_session_id}: {e}")
+            status, error = GenerationBuffer.FAILED, str(e)
+        finally:
+            if stream is not None:
+                stream.close()
+            self.buffer.finish(status, error)
+
+        if self.on_complete is not None:
+            try:
+                self.on_complete(self.buffer)
+            except Exception as e:
+                logger.error(f"[FE-WORKER] Completion callback failed for chat session {self.buffer.chat_session_id}: {e}")
+
+class GenerationManager(object):
+    """Process-wide registry of generation buffers, keyed by chat_session_id."""
+
+    def __init__(self):
+        self.api_conf = APIConfig()
+        self._lock = threading.Lock()
+        self._buffers: Dict[str, GenerationBuffer] = {}
+        self._workers: Dict[str, GenerationWorker] = {}
+
+    def _prune(self) -> None:
+        # Drop finished buffers nobody came back for; their answer is already persisted by on_complete.
+        cutoff = time.time() - self.api_conf.generation_buffer_ttl_seconds
+        for key, buffer in list(self._buffers.items()):
+            if buffer.done and (buffer.committed or (buffer.finished_at or 0) < cutoff):
+                self._buffers.pop(key, None)
+                self._workers.pop(key, None)
+
+    def start(self, chat_session_id: str, stream_factory: Callable, on_complete: Optional[Callable[[GenerationBuffer], None]] = None, agent_name: str = None, chat_model: str = None) -> GenerationBuffer:
+        """Start a background generation for the chat session and return its buffer."""
+        buffer = GenerationBuffer(chat_session_id, agent_name=agent_name, chat_model=chat_model)
+        worker = GenerationWorker(buffer, stream_factory, on_complete)
+        with self._lock:
+            self._prune()
+            self._buffers[chat_session_id] = buffer
+            self._workers[chat_session_id] = worker
+        worker.start()
+        return buffer
+
+    def get(self, chat_session_id: str) -> Optional[GenerationBuffer]:
+        with self._lock:
+            return self._buffers.get(chat_session_id)
+
+    def mark_cancelled(self, chat_session_id: str) -> None:
+        with self._lock:
+            worker = self._workers.get(chat_session_id)
+        if worker is not None:
+            worker.cancelled.set()
+
+    def commit(self, chat_session_id: str, buffer: GenerationBuffer) -> bool:
+        """Mark the buffer as added to the session history. Returns False if it already was."""
+        with self._lock:
+            if buffer.committed:
+                return False
+            buffer.committed = True
+            if self._buffers.get(chat_session_id) is buffer:
+                self._buffers.pop(chat_session_id, None)
+                self._workers.pop(chat_session_id, None)
+            return True
+
+    def in_flight(self) -> List[GenerationBuffer]:
+        """Return buffers whose generation has not finished yet."""
+        with self._lock:
+            return [buffer for buffer in self._buffers.values() if not buffer.done]
+
+generation_manager = GenerationManager()
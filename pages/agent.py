@@ -1,14 +1,17 @@
-import base64
 import streamlit as st
 from helpers.loog import logger
 from helpers.config import AppConfig, APIConfig
 from helpers.http import MakeRequest
+from helpers.assets import AssetIndex
+from helpers.catalog import CatalogService
 
 class AgentPage:
     def __init__(self):
         self.app_conf = AppConfig()
         self.api_conf = APIConfig()
         self.make_request = MakeRequest()
+        self.asset_index = AssetIndex()
+        self.catalog = CatalogService(self.make_request)
 
         @st.dialog("Agent Configuration", width="medium")
         def agent_configuration_dialog():
@@ -58,7 +61,7 @@ class AgentPage:
         all_tool_display_names = [tool_display_with_status(tool) for tool in tools_sorted]
 
         agent_logo_path = self.create_agent_logo_path(agent['logo'])
-        base64_logo = base64.b64encode(open(agent_logo_path, "rb").read()).decode("utf-8")
+        base64_logo = self.asset_index.get_base64(agent_logo_path)
         st.markdown(
             f"""
             <div style="text-align: left;">
@@ -200,6 +203,7 @@ class AgentPage:
                 }
             resp_json, status_code = self.make_request.put(endpoint=self.api_conf.agent_endpoint + str(agent["id"]), data=payload)
             if status_code == 200:
+                self.catalog.invalidate()
                 st.session_state["agent_dialog_open"] = False
                 st.session_state["current_agent"] = None
 
@@ -224,7 +228,7 @@ class AgentPage:
         with st.container(border=True, key=card_key):
             card_cols = st.columns([8, 2])
             agent_logo_path = self.create_agent_logo_path(agent['logo'])
-            base64_logo = base64.b64encode(open(agent_logo_path, "rb").read()).decode("utf-8")
+            base64_logo = self.asset_index.get_base64(agent_logo_path)
 
             with card_cols[0]:
                 st.markdown(
@@ -1,16 +1,22 @@
-import base64
 import streamlit as st
 from helpers.loog import logger
 from helpers.utils import Utils
 from helpers.http import MakeRequest
-from helpers.config import AppConfig, AWSConfig, APIConfig
-from langchain_community.chat_message_histories import StreamlitChatMessageHistory
+from helpers.assets import AssetIndex
+from helpers.catalog import CatalogService
+from helpers.history import ChatHistory, ChatMessage
+from helpers.storage import get_conversation_store
+from helpers.worker import GenerationBuffer, generation_manager
+from helpers.config import AppConfig, AWSConfig, APIConfig, StorageConfig
 
 app_conf = AppConfig()
 aws_conf = AWSConfig()
 api_conf = APIConfig()
+storage_conf = StorageConfig()
 make_request = MakeRequest()
 utils = Utils()
+asset_index = AssetIndex()
+catalog = CatalogService(make_request)
 
 def init_session_state():
     """Initialize session state."""
@@ -26,6 +32,8 @@ def init_session_state():
         st.session_state.agent_logo = None
     if "agent_logo_path" not in st.session_state:
         st.session_state.agent_logo_path = None
+    if "chat_render_count" not in st.session_state:
+        st.session_state.chat_render_count = app_conf.chat_render_window
 
 def save_feedback(message_index: int):
     """Save user feedback and send to backend."""
@@ -36,11 +44,14 @@ def save_feedback(message_index: int):
         st.session_state.feedback = {}
     st.session_state.feedback[message_index] = user_feedback
 
-    # Retrieve message content (safe lookup)
+    # Retrieve message content (safe lookup). message_index is the absolute position in the
+    # conversation; only the messages from chat_history_offset onwards are held in memory.
+    message_content = None
     msgs = st.session_state.get("chat_history", None)
     if isinstance(msgs, list):
-        if 0 <= message_index < len(msgs):
-            message_content = getattr(msgs[message_index], "content", None)
+        local_index = message_index - st.session_state.get("chat_history_offset", 0)
+        if 0 <= local_index < len(msgs):
+            message_content = getattr(msgs[local_index], "content", None)
     elif hasattr(msgs, "messages"):
         all_msgs = getattr(msgs, "messages", [])
         if 0 <= message_index < len(all_msgs):
@@ -62,9 +73,79 @@ def save_feedback(message_index: int):
     except Exception as e:
         logger.error(f"[Feedback] Failed to send feedback: {e}")
 
+def stop_generation(chat_session_id: str):
+    """Stop button callback: cancel the in-flight generation for this chat session."""
+    generation_manager.mark_cancelled(chat_session_id)
+    if make_request.cancel_chat_completions(chat_session_id):
+        st.toast("Generation stopped.", icon="⏹️")
+
+def start_generation(msgs: ChatHistory, chat_model: str, prompt: str, attachments: list) -> GenerationBuffer:
+    """Start streaming the answer on a background worker that survives reruns."""
+    chat_session_id = str(st.session_state.get("chat_session_id"))
+    agent_name = st.session_state.agent_name
+    history = msgs.snapshot()
+    store, user_id, position = msgs.store, msgs.user_id, msgs.position_of(len(msgs.messages))
+
+    def stream_factory():
+        return make_request.stream_chat_completions(agent_name=agent_name, chat_model=chat_model, history=history, prompt=prompt, attachments=attachments, chat_session_id=chat_session_id)
+
+    def on_complete(buffer: GenerationBuffer):
+        # Persist from the worker so the answer survives even if the session never reruns.
+        if store is not None and buffer.text:
+            store.append(user_id, chat_session_id, position, ChatMessage("assistant", format_generation(buffer)))
+
+    return generation_manager.start(chat_session_id, stream_factory, on_complete, agent_name=agent_name, chat_model=chat_model)
+
+def format_generation(buffer: GenerationBuffer) -> str:
+    if buffer.status == GenerationBuffer.CANCELLED:
+        return buffer.text + "\n\n*(stopped)*"
+    return buffer.text
+
+def render_generation(buffer: GenerationBuffer, msgs: ChatHistory):
+    """Render an in-progress (or just finished) generation and add it to the history once it is done."""
+    chat_session_id = buffer.chat_session_id
+    with st.chat_message("assistant", avatar=st.session_state.get("agent_logo_path", app_conf.agent_logo_path)):
+        placeholder = st.empty()
+        stop_placeholder = st.empty()
+        if not buffer.done:
+            stop_placeholder.button("Stop", key="stop_generation", icon="⏹️", on_click=stop_generation, args=[chat_session_id], type="tertiary")
+
+        # A rerun interrupts this loop, not the worker: the next rerun reattaches to the same buffer.
+        seen_chunks = -1
+        while not buffer.done:
+            if buffer.chunk_count != seen_chunks:
+                seen_chunks = buffer.chunk_count
+                placeholder.markdown(buffer.text + "▌")
+            buffer.wait_for_update(seen_chunks, timeout=0.25)
+        stop_placeholder.empty()
+
+        full_response = format_generation(buffer)
+        placeholder.markdown(full_response)
+
+        if generation_manager.commit(chat_session_id, buffer):
+            msgs.add_ai_message(full_response)
+
+        # Feedback for new AI message
+        idx = msgs.position_of(len(msgs.messages) - 1)
+        st.session_state[f"feedback_{idx}"] = None
+        st.feedback(
+            "thumbs",
+            key=f"feedback_{idx}",
+            on_change=save_feedback,
+            args=[idx],
+        )
+
+def load_earlier_messages(msgs: ChatHistory):
+    """Widen the rendered window, paging older messages in from storage when memory runs out."""
+    render_count = st.session_state.get("chat_render_count", app_conf.chat_render_window) + app_conf.chat_render_window
+    missing = render_count - len(msgs.messages)
+    if missing > 0:
+        msgs.load_earlier(max(missing, storage_conf.chat_history_window))
+    st.session_state.chat_render_count = render_count
+
 def render_model_selector(agent_llms: list):
     """Render model selector with session persistence."""
-    llms_resp_json, _ = make_request.get(endpoint=api_conf.llm_endpoint + "enabled")
+    llms_resp_json = catalog.get_enabled_llms() or []
     llms_sorted = sorted(llms_resp_json, key=lambda x: x["display_name"].lower())
     
     model_options = [(llm["display_name"], llm["name"]) for llm in llms_sorted if llm["name"] in [agent_llm["name"] for agent_llm in agent_llms]]
@@ -114,7 +195,7 @@ class AssistantPage:
         pass
     
     def display(self):
-        agent_resp_json, _ = make_request.get(endpoint=api_conf.agent_endpoint + "default")
+        agent_resp_json = catalog.get_default_agent() or {}
         agent_name = agent_resp_json.get("name", None)
         agent_llms = agent_resp_json.get("llm_ids", None)
 
@@ -127,7 +208,7 @@ class AssistantPage:
             st.error("No default agent found.")
             st.stop()
 
-        base64_logo = base64.b64encode(open(st.session_state.agent_logo_path, "rb").read()).decode("utf-8")
+        base64_logo = asset_index.get_base64(st.session_state.agent_logo_path)
         st.markdown(f"### <img src='data:image/png;base64,{base64_logo}' alt='{st.session_state.agent_display_name}' style='width: 40px;'/> {st.session_state.agent_display_name}", unsafe_allow_html=True)
 
         init_session_state()
@@ -138,13 +219,35 @@ class AssistantPage:
             st.error("No LLMs found for the agent.")
             st.stop()
 
-        msgs = StreamlitChatMessageHistory(key="chat_history")
+        userinfo = st.session_state.get("userinfo") or {}
+        msgs = ChatHistory(
+            key="chat_history",
+            store=get_conversation_store(),
+            user_id=userinfo.get("username"),
+            chat_session_id=st.session_state.get("chat_session_id"),
+            window=storage_conf.chat_history_window,
+            max_in_memory=storage_conf.chat_history_max_in_memory,
+        )
 
         # if not msgs.messages:
         #     msgs.add_ai_message("👋 Hello! How can I assist you today?")
 
-        # Display chat history
-        for idx, msg in enumerate(msgs.messages):
+        # Display chat history: only the last chat_render_count messages are drawn (and get feedback
+        # widgets), so rerun cost does not grow with the length of the conversation.
+        first_visible = max(len(msgs.messages) - st.session_state.chat_render_count, 0)
+        hidden_count = msgs.offset + first_visible
+        if hidden_count > 0:
+            st.button(
+                f"Load earlier messages ({hidden_count} hidden)",
+                key="load_earlier_messages",
+                on_click=load_earlier_messages,
+                args=[msgs],
+                type="tertiary",
+            )
+
+        for local_idx in range(first_visible, len(msgs.messages)):
+            msg = msgs.messages[local_idx]
+            idx = msgs.position_of(local_idx)
             role = "assistant" if msg.type == "ai" else "user"
 
             if role == "user":
@@ -163,8 +266,16 @@ class AssistantPage:
                         args=[idx],
                     )
 
-        # Input box
-        if message := st.chat_input("Type your message here...", accept_file="multiple", file_type=["txt", "pdf", "docx", "png", "jpg", "jpeg", "csv", "xlsx"]):
+        # Input box (pinned to the bottom; disabled while an answer is still streaming)
+        buffer = generation_manager.get(str(st.session_state.get("chat_session_id")))
+        generating = buffer is not None and not buffer.done
+        message = st.chat_input("Type your message here...", accept_file="multiple", file_type=["txt", "pdf", "docx", "png", "jpg", "jpeg", "csv", "xlsx"], disabled=generating)
+
+        # Reattach to a generation still streaming from an earlier rerun
+        if buffer is not None and not buffer.committed:
+            render_generation(buffer, msgs)
+
+        if message:
 
             prompt = message["text"]
             files = message["files"]
@@ -177,7 +288,7 @@ class AssistantPage:
             if files:
                 attachments = utils.process_multiple_files(files)
             
-            msgs.add_user_message(prompt)
+            msgs.add_user_message(prompt, attachments=[attachment.name for attachment in attachments])
             st.chat_message("user").write(prompt)
 
             if files:
@@ -188,26 +299,9 @@ class AssistantPage:
                     else:
                         st.write(f"Attachment: {attachment.name} - {attachment.size_kb} KB")
 
-            # Stream AI response
-            with st.chat_message("assistant", avatar=st.session_state.get("agent_logo_path", app_conf.agent_logo_path)):
-                placeholder = st.empty()
-                full_response = ""
-                for chunk in make_request.stream_chat_completions(agent_name=st.session_state.agent_name, chat_model=chat_model_selected, history=msgs, prompt=prompt, attachments=attachments):
-                    full_response += chunk
-                    placeholder.markdown(full_response + "▌")
-                placeholder.markdown(full_response)
-
-                msgs.add_ai_message(full_response)
-                
-                # Feedback for new AI message
-                idx = len(msgs.messages) - 1
-                st.session_state[f"feedback_{idx}"] = None
-                st.feedback(
-                    "thumbs",
-                    key=f"feedback_{idx}",
-                    on_change=save_feedback,
-                    args=[idx],
-                )
+            # Stream AI response on a background worker; this rerun (and any later one) renders from its buffer
+            buffer = start_generation(msgs, chat_model_selected, prompt, attachments)
+            render_generation(buffer, msgs)
 
     def run(self):
         self.display()
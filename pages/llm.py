@@ -1,14 +1,17 @@
-import base64
 import streamlit as st
 from helpers.loog import logger
 from helpers.config import AppConfig, APIConfig
 from helpers.http import MakeRequest
+from helpers.assets import AssetIndex
+from helpers.catalog import CatalogService
 
 class LLMPage:
     def __init__(self):
         self.app_conf = AppConfig()
         self.api_conf = APIConfig()
         self.make_request = MakeRequest()
+        self.asset_index = AssetIndex()
+        self.catalog = CatalogService(self.make_request)
         
         @st.dialog("LLM Configuration", width="medium")
         def llm_configuration_dialog():
@@ -33,7 +36,7 @@ class LLMPage:
 
     def flexible_llm_dialog(self, llm: dict):
         llm_logo_path = self.create_llm_logo_path(llm['logo'])
-        base64_logo = base64.b64encode(open(llm_logo_path, "rb").read()).decode("utf-8")
+        base64_logo = self.asset_index.get_base64(llm_logo_path)
         st.markdown(
             f"""
             <div style="text-align: left;">
@@ -97,6 +100,7 @@ class LLMPage:
 
             resp_json, status_code = self.make_request.put(endpoint=self.api_conf.llm_endpoint + str(llm["id"]), data=payload)
             if status_code == 200:
+                self.catalog.invalidate()
                 st.session_state["llm_dialog_open"] = False
                 st.session_state["current_model"] = None
 
@@ -117,7 +121,7 @@ class LLMPage:
         with st.container(border=True, key=card_key):
             card_cols = st.columns([8, 2])
             llm_logo_path = self.create_llm_logo_path(llm['logo'])
-            base64_logo = base64.b64encode(open(llm_logo_path, "rb").read()).decode("utf-8")
+            base64_logo = self.asset_index.get_base64(llm_logo_path)
 
             with card_cols[0]:
                 st.markdown(
@@ -1,10 +1,10 @@
 import streamlit as st
 import uuid
-import base64
 from helpers.utils import Utils
 from helpers.config import AppConfig, APIConfig
 from helpers.loog import logger
 from helpers.http import MakeRequest
+from helpers.assets import AssetIndex
 from passlib.context import CryptContext
 from helpers.auth import verify_jwt_token, create_jwt_cookie
 
@@ -16,13 +16,14 @@ class LoginPage:
         self.api_conf = APIConfig()
         self.utils = Utils()
         self.make_request = MakeRequest()
+        self.asset_index = AssetIndex()
 
     def display(self):
         st.logo(self.app_conf.logo_path, size="large", icon_image=self.app_conf.logo_path)
 
         col1, col2, col3 = st.columns([1, 2, 1])
         with col2:
-            base64_logo = base64.b64encode(open(self.app_conf.logo_path, "rb").read()).decode("utf-8")
+            base64_logo = self.asset_index.get_base64(self.app_conf.logo_path)
             st.markdown(
                 f"""
                 <div style="text-align: left;">
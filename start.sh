@@ -0,0 +1,20 @@
+#!/bin/bash
+set -e
+
+# Start nginx
+nginx
+
+# Start streamlit
+streamlit run app.py --server.port=8501 --server.address=0.0.0.0 &
+STREAMLIT_PID=$!
+
+# Trigger the warm-up stage as soon as the server accepts connections, so the
+# process is warm before the health check lets traffic in.
+(
+    until curl --silent --fail http://localhost:8501/_stcore/health > /dev/null; do
+        sleep 1
+    done
+    curl --silent http://localhost:8501/_stcore/script-health-check > /dev/null || true
+) &
+
+wait $STREAMLIT_PID
@@ -0,0 +1,102 @@
+"""
+Unit tests for helpers/cache.py
+"""
+import pytest
+from unittest.mock import Mock, patch
+from helpers.cache import TTLCache, get_cache_stats
+
+
+class TestTTLCache:
+    """Test TTLCache class."""
+
+    def test_get_missing_returns_default(self):
+        """Test get on an empty cache."""
+        cache = TTLCache("test-missing", ttl_seconds=60)
+
+        assert cache.get("key") is None
+        assert cache.get("key", "default") == "default"
+        assert cache.misses == 2
+
+    def test_set_and_get(self):
+        """Test a stored value is returned and counted as a hit."""
+        cache = TTLCache("test-set-get", ttl_seconds=60)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+        assert cache.hits == 1
+
+    @patch('helpers.cache.time.monotonic')
+    def test_entry_expires(self, mock_monotonic):
+        """Test entries are dropped after their TTL."""
+        mock_monotonic.return_value = 100.0
+        cache = TTLCache("test-expiry", ttl_seconds=10)
+        cache.set("key", "value")
+
+        mock_monotonic.return_value = 105.0
+        assert cache.get("key") == "value"
+
+        mock_monotonic.return_value = 111.0
+        assert cache.get("key") is None
+
+    def test_no_ttl_never_expires(self):
+        """Test a cache without TTL keeps entries."""
+        cache = TTLCache("test-no-ttl", ttl_seconds=None)
+        cache.set("key", "value")
+
+        assert cache.get("key") == "value"
+
+    def test_maxsize_evicts_oldest(self):
+        """Test the oldest entry is evicted when the cache is full."""
+        cache = TTLCache("test-maxsize", ttl_seconds=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_get_or_load_caches_result(self):
+        """Test get_or_load only calls the loader on a miss."""
+        cache = TTLCache("test-load", ttl_seconds=60)
+        loader = Mock(return_value={"data": "test"})
+
+        assert cache.get_or_load("key", loader) == {"data": "test"}
+        assert cache.get_or_load("key", loader) == {"data": "test"}
+        loader.assert_called_once()
+
+    def test_get_or_load_does_not_cache_none(self):
+        """Test a None loader result is retried on the next call."""
+        cache = TTLCache("test-load-none", ttl_seconds=60)
+        loader = Mock(return_value=None)
+
+        assert cache.get_or_load("key", loader) is None
+        assert cache.get_or_load("key", loader) is None
+        assert loader.call_count == 2
+
+    def test_invalidate(self):
+        """Test invalidating a single key and the whole cache."""
+        cache = TTLCache("test-invalidate", ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+        cache.invalidate()
+        assert cache.get("b") is None
+
+    def test_stats(self):
+        """Test stats report hit ratio and registry lookup."""
+        cache = TTLCache("test-stats", ttl_seconds=60)
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("other")
+
+        stats = cache.stats()
+        assert stats["size"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_ratio"] == pytest.approx(0.5)
+        assert any(s["name"] == "test-stats" for s in get_cache_stats())
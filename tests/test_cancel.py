@@ -0,0 +1,113 @@
+"""
+Unit tests for helpers/cancel.py and stream cancellation in helpers/http.py
+"""
+import pytest
+from unittest.mock import Mock, MagicMock, patch
+from helpers.cancel import CancellationRegistry
+from helpers.http import MakeRequest
+
+
+class TestCancellationRegistry:
+    """Test CancellationRegistry class."""
+
+    def test_cancel_sets_event(self):
+        """Test cancelling a running generation."""
+        registry = CancellationRegistry()
+        event = registry.start("session-1")
+
+        assert registry.cancel("session-1") is True
+        assert event.is_set()
+
+    def test_cancel_unknown_key(self):
+        """Test cancelling when nothing is running."""
+        registry = CancellationRegistry()
+        assert registry.cancel("missing") is False
+
+    def test_cancel_closes_attached_response(self):
+        """Test the open response is closed to release the connection."""
+        registry = CancellationRegistry()
+        event = registry.start("session-1")
+        response = Mock()
+        registry.attach("session-1", event, response)
+
+        registry.cancel("session-1")
+
+        response.close.assert_called_once()
+
+    def test_finish_ignores_replaced_generation(self):
+        """Test finishing an old generation does not unregister a newer one."""
+        registry = CancellationRegistry()
+        old_event = registry.start("session-1")
+        registry.start("session-1")
+
+        registry.finish("session-1", old_event)
+
+        assert registry.is_running("session-1") is True
+
+
+class TestStreamCancellation:
+    """Test cancellation wired into stream_chat_completions."""
+
+    def _make_request(self, chunks):
+        with patch('helpers.http.MakeRequest.__init__', lambda self: None):
+            make_request = MakeRequest()
+        make_request.api_conf = Mock()
+        make_request.api_conf.api_service = "http://test-api.com/"
+        make_request.api_conf.chat_agent_completions_endpoint = "chat/agent/completions"
+        make_request.api_conf.chat_cancel_endpoint = "chat/cancel"
+        make_request.api_conf.chat_cancel_enabled = True
+        make_request.api_conf.api_timeout_seconds = 300
+        make_request.api_conf.chat_cancel_timeout_seconds = 5
+        make_request.aws_secret_manager = Mock()
+        make_request.aws_secret_manager.get_secret.return_value = "test_auth_token"
+
+        response = MagicMock()
+        response.iter_bytes.return_value = iter(chunks)
+        client = MagicMock()
+        client.stream.return_value.__enter__.return_value = response
+        return make_request, client
+
+    def _stream(self, make_request):
+        history = Mock()
+        history.messages = []
+        return make_request.stream_chat_completions(
+            agent_name="test_agent",
+            chat_model="test_model",
+            history=history,
+            prompt="test prompt",
+            attachments=[],
+            chat_session_id="session-1",
+        )
+
+    def test_completed_stream_does_not_abort(self):
+        """Test a stream read to the end does not call the cancel endpoint."""
+        make_request, client = self._make_request([b"a", b"b"])
+        with patch('helpers.http.get_http_client', return_value=client):
+            chunks = list(self._stream(make_request))
+
+        assert chunks == ["a", "b"]
+        client.post.assert_not_called()
+
+    def test_closing_stream_aborts_backend(self):
+        """Test closing the generator early releases the stream and notifies the backend."""
+        make_request, client = self._make_request([b"a", b"b", b"c"])
+        with patch('helpers.http.get_http_client', return_value=client):
+            stream = self._stream(make_request)
+            assert next(stream) == "a"
+            stream.close()
+
+        client.stream.return_value.__exit__.assert_called_once()
+        client.post.assert_called_once()
+        assert client.post.call_args[1]["json"] == {"chat_session_id": "session-1"}
+
+    def test_cancel_stops_stream(self):
+        """Test cancel_chat_completions stops the stream at the next chunk."""
+        make_request, client = self._make_request([b"a", b"b", b"c"])
+        with patch('helpers.http.get_http_client', return_value=client):
+            stream = self._stream(make_request)
+            assert next(stream) == "a"
+            assert make_request.cancel_chat_completions("session-1") is True
+            remaining = list(stream)
+
+        assert remaining == []
+        client.post.assert_called_once()
@@ -0,0 +1,86 @@
+"""
+Unit tests for helpers/history.py
+"""
+import pytest
+from unittest.mock import patch
+from helpers.history import ChatHistory, ChatMessage, estimate_tokens
+
+
+class TestChatMessage:
+    """Test ChatMessage record."""
+
+    def test_user_message_type(self):
+        """Test user messages map to the human type."""
+        message = ChatMessage("user", "hello")
+        assert message.type == "human"
+        assert message.content == "hello"
+
+    def test_assistant_message_type(self):
+        """Test assistant messages map to the ai type."""
+        message = ChatMessage("assistant", "hi there")
+        assert message.type == "ai"
+
+    def test_token_count_cached(self):
+        """Test token count is computed once on creation."""
+        message = ChatMessage("user", "x" * 40)
+        assert message.token_count == 10
+
+    def test_attachments_stored_as_tuple(self):
+        """Test attachment references are kept as an immutable tuple."""
+        message = ChatMessage("user", "see file", attachments=["a.pdf", "b.png"])
+        assert message.attachments == ("a.pdf", "b.png")
+
+    def test_slots_prevent_new_attributes(self):
+        """Test records do not carry a per-instance __dict__."""
+        message = ChatMessage("user", "hello")
+        with pytest.raises(AttributeError):
+            message.extra = "value"
+
+    def test_estimate_tokens_empty(self):
+        """Test empty content has no tokens."""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("a") == 1
+
+
+class TestChatHistory:
+    """Test ChatHistory store."""
+
+    @patch('helpers.history.st.session_state', {})
+    def test_init_creates_empty_list(self):
+        """Test a new history starts empty."""
+        history = ChatHistory(key="chat_history")
+        assert history.messages == []
+
+    @patch('helpers.history.st.session_state', {})
+    def test_add_messages(self):
+        """Test adding user and assistant messages."""
+        history = ChatHistory(key="chat_history")
+        history.add_user_message("question", attachments=["doc.pdf"])
+        history.add_ai_message("answer")
+
+        assert [m.type for m in history.messages] == ["human", "ai"]
+        assert history.messages[0].attachments == ("doc.pdf",)
+        assert history.messages[1].content == "answer"
+
+    @patch('helpers.history.st.session_state', {})
+    def test_history_survives_rerun(self):
+        """Test a second instance with the same key sees existing messages."""
+        ChatHistory(key="chat_history").add_user_message("question")
+        history = ChatHistory(key="chat_history")
+        assert len(history.messages) == 1
+
+    @patch('helpers.history.st.session_state', {})
+    def test_clear(self):
+        """Test clearing the history."""
+        history = ChatHistory(key="chat_history")
+        history.add_user_message("question")
+        history.clear()
+        assert history.messages == []
+
+    @patch('helpers.history.st.session_state', {})
+    def test_token_count(self):
+        """Test total token count across messages."""
+        history = ChatHistory(key="chat_history")
+        history.add_user_message("x" * 8)
+        history.add_ai_message("y" * 12)
+        assert history.token_count == 5
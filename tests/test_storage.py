@@ -0,0 +1,118 @@
+"""
+Unit tests for helpers/storage.py
+"""
+import pytest
+import sqlite3
+from unittest.mock import patch
+from helpers.history import ChatHistory, ChatMessage
+from helpers.storage import ConversationStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Create a conversation store in a temporary directory."""
+    return ConversationStore(str(tmp_path / "conversations.db"))
+
+
+class TestConversationStore:
+    """Test ConversationStore class."""
+
+    def test_wal_mode_enabled(self, store):
+        """Test the database runs in WAL mode."""
+        mode = store._connection().execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_append_and_load_recent(self, store):
+        """Test only the most recent messages are loaded, oldest first."""
+        for position in range(5):
+            store.append("alice", "s1", position, ChatMessage("user", f"message {position}"))
+
+        recent = store.load_recent("alice", "s1", 2)
+
+        assert [m.content for m in recent] == ["message 3", "message 4"]
+        assert store.count("alice", "s1") == 5
+
+    def test_load_before(self, store):
+        """Test paging older messages before a position."""
+        for position in range(5):
+            store.append("alice", "s1", position, ChatMessage("user", f"message {position}"))
+
+        earlier = store.load_before("alice", "s1", 3, 2)
+
+        assert [m.content for m in earlier] == ["message 1", "message 2"]
+
+    def test_conversations_are_isolated(self, store):
+        """Test messages are keyed by user and chat session."""
+        store.append("alice", "s1", 0, ChatMessage("user", "alice"))
+        store.append("bob", "s1", 0, ChatMessage("user", "bob"))
+
+        assert [m.content for m in store.load_recent("alice", "s1", 10)] == ["alice"]
+        assert store.count("bob", "s2") == 0
+
+    def test_message_fields_round_trip(self, store):
+        """Test role, attachments and token count survive storage."""
+        store.append("alice", "s1", 0, ChatMessage("assistant", "answer", attachments=["a.pdf"], token_count=7))
+
+        message = store.load_recent("alice", "s1", 1)[0]
+
+        assert message.type == "ai"
+        assert message.attachments == ("a.pdf",)
+        assert message.token_count == 7
+
+    def test_latest_session(self, store):
+        """Test the most recently updated session is returned."""
+        assert store.latest_session("alice") is None
+
+        store.append("alice", "old", 0, ChatMessage("user", "first"))
+        store.append("alice", "new", 0, ChatMessage("user", "second"))
+
+        assert store.latest_session("alice") == "new"
+
+
+class TestChatHistoryWithStore:
+    """Test ChatHistory bound to a ConversationStore."""
+
+    @patch('helpers.history.st.session_state', {})
+    def test_messages_written_through(self, store):
+        """Test added messages are persisted at their absolute position."""
+        history = ChatHistory(store=store, user_id="alice", chat_session_id="s1")
+        history.add_user_message("question")
+        history.add_ai_message("answer")
+
+        assert store.count("alice", "s1") == 2
+
+    def test_resume_loads_recent_window(self, store):
+        """Test a resumed session only loads the configured window."""
+        for position in range(10):
+            store.append("alice", "s1", position, ChatMessage("user", f"message {position}"))
+
+        with patch('helpers.history.st.session_state', {}):
+            history = ChatHistory(store=store, user_id="alice", chat_session_id="s1", window=3)
+
+            assert [m.content for m in history.messages] == ["message 7", "message 8", "message 9"]
+            assert history.offset == 7
+            assert history.has_earlier is True
+
+            assert history.load_earlier(5) == 5
+            assert history.messages[0].content == "message 2"
+            assert history.offset == 2
+
+    @patch('helpers.history.st.session_state', {})
+    def test_in_memory_history_is_capped(self, store):
+        """Test older messages are dropped from memory but kept on disk."""
+        history = ChatHistory(store=store, user_id="alice", chat_session_id="s1", window=2, max_in_memory=3)
+        for i in range(5):
+            history.add_user_message(f"message {i}")
+
+        assert [m.content for m in history.messages] == ["message 2", "message 3", "message 4"]
+        assert history.position_of(0) == 2
+        assert store.count("alice", "s1") == 5
+
+    @patch('helpers.history.st.session_state', {})
+    def test_new_session_resets_history(self, store):
+        """Test switching chat session reloads the history."""
+        ChatHistory(store=store, user_id="alice", chat_session_id="s1").add_user_message("old")
+
+        history = ChatHistory(store=store, user_id="alice", chat_session_id="s2")
+
+        assert history.messages == []
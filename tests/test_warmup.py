@@ -0,0 +1,61 @@
+"""
+Unit tests for helpers/warmup.py
+"""
+import pytest
+from unittest.mock import Mock, patch
+from helpers.warmup import WarmUp
+
+
+class TestWarmUp:
+    """Test WarmUp class."""
+
+    def _make_warmup(self, tmp_path):
+        with patch('helpers.warmup.WarmUp.__init__', lambda self: None):
+            warmup = WarmUp()
+        warmup.app_conf = Mock()
+        warmup.app_conf.warmup_ready_file = str(tmp_path / "ready")
+        warmup.api_conf = Mock()
+        warmup.api_conf.api_warm_connections = 2
+        warmup.aws_secret_manager = Mock()
+        warmup.aws_secret_manager.get_secret_bundle.return_value = {"key": "value"}
+        warmup.make_request = Mock()
+        warmup.make_request.warm_connections.return_value = 2
+        warmup.asset_index = Mock()
+        warmup.asset_index.load.return_value = 5
+        warmup.catalog = Mock()
+        warmup.catalog.get_default_agent.return_value = {"name": "yang"}
+        warmup.catalog.get_enabled_llms.return_value = [{"name": "claude"}]
+        return warmup
+
+    def test_run_all_steps_ok(self, tmp_path):
+        """Test every step is run and reported."""
+        warmup = self._make_warmup(tmp_path)
+
+        status = warmup.run()
+
+        assert set(status) == {"secrets", "connections", "assets", "default_agent", "enabled_llms"}
+        assert all(step["ok"] for step in status.values())
+        warmup.make_request.warm_connections.assert_called_once_with(2)
+
+    def test_run_continues_after_failure(self, tmp_path):
+        """Test a failing step does not stop the remaining steps."""
+        warmup = self._make_warmup(tmp_path)
+        warmup.aws_secret_manager.get_secret_bundle.side_effect = Exception("AWS down")
+        warmup.catalog.get_default_agent.return_value = None
+
+        status = warmup.run()
+
+        assert status["secrets"]["ok"] is False
+        assert status["default_agent"]["ok"] is False
+        assert status["assets"]["ok"] is True
+        warmup.catalog.get_enabled_llms.assert_called_once()
+
+    def test_mark_and_clear_ready(self, tmp_path):
+        """Test the ready file is written and removed."""
+        warmup = self._make_warmup(tmp_path)
+
+        warmup.mark_ready()
+        assert (tmp_path / "ready").exists()
+
+        warmup.clear_ready()
+        assert not (tmp_path / "ready").exists()
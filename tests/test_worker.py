@@ -0,0 +1,121 @@
+"""
+Unit tests for helpers/worker.py
+"""
+import pytest
+import threading
+from unittest.mock import Mock
+from helpers.worker import GenerationBuffer, GenerationManager
+
+
+def _wait_done(buffer, timeout=5):
+    while not buffer.done:
+        buffer.wait_for_update(buffer.chunk_count, timeout=timeout)
+
+
+class TestGenerationBuffer:
+    """Test GenerationBuffer class."""
+
+    def test_append_and_text(self):
+        """Test chunks are concatenated into the buffer text."""
+        buffer = GenerationBuffer("session-1")
+        buffer.append("Hello ")
+        buffer.append("world")
+
+        assert buffer.text == "Hello world"
+        assert buffer.chunk_count == 2
+        assert buffer.done is False
+
+    def test_finish(self):
+        """Test finishing records status and completion time."""
+        buffer = GenerationBuffer("session-1")
+        buffer.finish(GenerationBuffer.FAILED, "boom")
+
+        assert buffer.done is True
+        assert buffer.error == "boom"
+        assert buffer.finished_at is not None
+
+    def test_wait_for_update_wakes_on_chunk(self):
+        """Test a waiting reader is woken by a new chunk."""
+        buffer = GenerationBuffer("session-1")
+        timer = threading.Timer(0.05, buffer.append, args=["chunk"])
+        timer.start()
+
+        buffer.wait_for_update(0, timeout=5)
+
+        assert buffer.chunk_count == 1
+
+
+class TestGenerationManager:
+    """Test GenerationManager class."""
+
+    def test_worker_fills_buffer(self):
+        """Test the worker consumes the stream into the buffer and calls on_complete."""
+        manager = GenerationManager()
+        on_complete = Mock()
+
+        buffer = manager.start("session-1", lambda: iter(["a", "b", "c"]), on_complete)
+        _wait_done(buffer)
+
+        assert buffer.text == "abc"
+        assert buffer.status == GenerationBuffer.DONE
+        assert manager.get("session-1") is buffer
+        manager._workers["session-1"].join(timeout=5)
+        on_complete.assert_called_once_with(buffer)
+
+    def test_stream_error_marks_failed(self):
+        """Test an exception in the stream marks the buffer as failed."""
+        manager = GenerationManager()
+
+        def failing_stream():
+            yield "partial"
+            raise RuntimeError("backend gone")
+
+        buffer = manager.start("session-1", failing_stream)
+        _wait_done(buffer)
+
+        assert buffer.status == GenerationBuffer.FAILED
+        assert buffer.text == "partial"
+
+    def test_mark_cancelled(self):
+        """Test a cancelled worker finishes with the cancelled status."""
+        manager = GenerationManager()
+        release = threading.Event()
+
+        def slow_stream():
+            yield "a"
+            release.wait(timeout=5)
+
+        buffer = manager.start("session-1", slow_stream)
+        buffer.wait_for_update(0, timeout=5)
+        manager.mark_cancelled("session-1")
+        release.set()
+        _wait_done(buffer)
+
+        assert buffer.status == GenerationBuffer.CANCELLED
+
+    def test_commit_once(self):
+        """Test a buffer is committed to history only once and then released."""
+        manager = GenerationManager()
+        buffer = manager.start("session-1", lambda: iter(["a"]))
+        _wait_done(buffer)
+
+        assert manager.commit("session-1", buffer) is True
+        assert manager.commit("session-1", buffer) is False
+        assert manager.get("session-1") is None
+
+    def test_in_flight(self):
+        """Test only unfinished generations are reported as in flight."""
+        manager = GenerationManager()
+        release = threading.Event()
+
+        def slow_stream():
+            release.wait(timeout=5)
+            yield "a"
+
+        running = manager.start("running", slow_stream)
+        finished = manager.start("finished", lambda: iter(["b"]))
+        _wait_done(finished)
+
+        assert manager.in_flight() == [running]
+        release.set()
+        _wait_done(running)